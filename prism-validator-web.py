@@ -5,12 +5,21 @@ A simple Flask web app that provides a user-friendly interface for dataset valid
 """
 
 import os
+import re
 import sys
 import json
 import tempfile
 import shutil
 import webbrowser
 import threading
+import time
+import uuid
+import unicodedata
+from urllib.parse import quote
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, is_dataclass
+from typing import Optional
 from pathlib import Path
 from datetime import datetime
 from flask import (
@@ -18,17 +27,26 @@ from flask import (
     render_template,
     request,
     jsonify,
-    send_file,
     flash,
     redirect,
     url_for,
+    Response,
 )
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.datastructures import FileStorage
 from werkzeug.utils import secure_filename
 import zipfile
+import zlib
 import io
 import requests
 from functools import lru_cache
 
+# Optional fast JSON encoder for large reports
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Ensure we can import core validator logic from src
 BASE_DIR = Path(__file__).resolve().parent
 SRC_DIR = BASE_DIR / "src"
@@ -210,22 +228,25 @@ class SimpleStats:
         return []
 
 
-def simple_is_system_file(filename):
-    """Simple system file detection"""
-    if not filename:
-        return True
-    system_files = [
+_SYSTEM_FILE_NAMES = frozenset(
+    {
         ".DS_Store",
         "._.DS_Store",
+        ".Spotlight-V100",
+        ".Trashes",
         "Thumbs.db",
         "ehthumbs.db",
         "Desktop.ini",
-    ]
-    if filename in system_files:
-        return True
-    if filename.startswith("._") or filename.startswith(".#"):
+    }
+)
+_SYSTEM_FILE_PREFIXES = ("._", ".#")
+
+
+def simple_is_system_file(filename):
+    """Simple system file detection (set lookup plus prefix check)"""
+    if not filename:
         return True
-    return False
+    return filename in _SYSTEM_FILE_NAMES or filename.startswith(_SYSTEM_FILE_PREFIXES)
 
 
 # Use simple system file detection
@@ -236,6 +257,12 @@ app.secret_key = "prism-validator-secret-key"  # Change this in production
 app.config["MAX_CONTENT_LENGTH"] = (
     100 * 1024 * 1024
 )  # 100MB max file size (metadata only)
+# Folder uploads send two form parts per file (the file and its path); Flask's
+# default limit of 1000 parts would reject datasets with ~500+ metadata files
+app.config["MAX_FORM_PARTS"] = 100_000
+# Limit for non-file form fields; the all_files field lists every path in the
+# dataset and outgrows Werkzeug's 500 KB default at roughly 10k files
+app.config["MAX_FORM_MEMORY_SIZE"] = 16 * 1024 * 1024
 
 # Register JSON Editor blueprint if available
 try:
@@ -251,31 +278,147 @@ except Exception as e:
 
 # File extensions to process (metadata and small data files only)
 # We skip large neuroimaging data files - we only validate their JSON sidecars
-METADATA_EXTENSIONS = {
-    ".json",  # Sidecar metadata
-    ".tsv",  # Behavioral/events data
-    ".csv",  # Alternative tabular format
-    ".txt",  # Text data/logs
-    ".edf",  # EEG/eye-tracking (relatively small)
-    ".bdf",  # BioSemi EEG format
-    ".png",
-    ".jpg",
-    ".jpeg",  # Stimulus images (psychology experiments)
-}
+METADATA_EXTENSIONS = frozenset(
+    {
+        ".json",  # Sidecar metadata
+        ".tsv",  # Behavioral/events data
+        ".csv",  # Alternative tabular format
+        ".txt",  # Text data/logs
+        ".edf",  # EEG/eye-tracking (relatively small)
+        ".bdf",  # BioSemi EEG format
+        ".png",
+        ".jpg",
+        ".jpeg",  # Stimulus images (psychology experiments)
+    }
+)
 
 # Extensions to SKIP (large data files we don't need)
-SKIP_EXTENSIONS = {
-    ".nii",
-    ".nii.gz",  # NIfTI neuroimaging (can be GB)
-    ".mp4",
-    ".avi",
-    ".mov",  # Video files
-    ".tiff",  # Large TIFF images
-    ".eeg",
-    ".dat",
-    ".fif",  # Large electrophysiology raw data
-    ".mat",  # MATLAB files (can be large)
-}
+SKIP_EXTENSIONS = frozenset(
+    {
+        ".nii",
+        ".nii.gz",  # NIfTI neuroimaging (can be GB)
+        ".mp4",
+        ".avi",
+        ".mov",  # Video files
+        ".tiff",  # Large TIFF images
+        ".eeg",
+        ".dat",
+        ".fif",  # Large electrophysiology raw data
+        ".mat",  # MATLAB files (can be large)
+    }
+)
+
+_NATIVE_SEP = os.sep
+
+# Non-seekable uploads up to this size are buffered in memory without touching disk
+ZIP_SPOOL_MAX_SIZE = 32 * 1024 * 1024
+# Request bodies with these types are read as a raw ZIP archive, not a form
+ZIP_MIMETYPES = frozenset({"application/zip", "application/x-zip-compressed"})
+COPY_BUFFER_SIZE = 1024 * 1024
+UPLOAD_SAVE_WORKERS = 8
+
+# Suffix tuples so ZIP members are classified with a single str.endswith call
+_METADATA_SUFFIXES = tuple(METADATA_EXTENSIONS)
+_SKIP_SUFFIXES = tuple(SKIP_EXTENSIONS)
+
+
+# Patterns used to locate file paths in validator messages
+_BIDS_MARKER_RE = re.compile(r"((?:sub-|ses-|dataset_description\.json).*)")
+_ABS_PATH_RE = re.compile(r"(/[^\s:,]+\.[A-Za-z0-9]+(?:\.gz)?)")
+_SUB_NAME_RE = re.compile(r"(sub-[A-Za-z0-9._-]+\.[A-Za-z0-9]+(?:\.gz)?)")
+_GENERIC_NAME_RE = re.compile(
+    r"([A-Za-z0-9._\-]+\.(?:json|tsv|edf|nii|nii\.gz|txt|csv|mp4|png|jpg|jpeg))"
+)
+# Temp folder prefixes to remove from message text: /tmp/, /T/, /var/folders/, prism_validator_
+_TEMP_DATASET_PATH_RE = re.compile(
+    r"(/tmp/[^\s,:]+/dataset/|/T/prism_validator_[^\s,:]+/dataset/|/var/folders/[^\s,:]+/dataset/|prism_validator_[^\s,:]+/dataset/)([^\s,:]+)"
+)
+_TEMP_SUBJECT_PATH_RE = re.compile(
+    r"(/tmp/[^\s,:]+/|/var/folders/[^\s,:]+/)(sub-[^\s,:/]+)"
+)
+
+
+@dataclass
+class FormattedIssue:
+    """A single issue as shown in the web results and JSON report.
+
+    Slotted to keep per-issue memory low when validation yields many issues.
+    """
+
+    __slots__ = ("code", "message", "file", "level")
+    code: str
+    message: str
+    file: Optional[str]
+    level: str
+
+
+def strip_temp_path(file_path, dataset_path):
+    """Strip temporary folder path prefix and keep only relative path from dataset root"""
+    if not file_path:
+        return None
+
+    # If it's a temp path, try to extract the relative path
+    if (
+        "/tmp/" in file_path
+        or "/T/prism_validator_" in file_path
+        or "/var/folders/" in file_path
+        or "prism_validator_" in file_path
+    ):
+        # Find the dataset root marker - typically after 'dataset/'
+        if "/dataset/" in file_path:
+            parts = file_path.split("/dataset/", 1)
+            if len(parts) > 1:
+                return parts[1]
+
+        # Alternative: look for BIDS structure markers (sub-, dataset_description.json)
+        match = _BIDS_MARKER_RE.search(file_path)
+        if match:
+            return match.group(1)
+
+    # If dataset_path is a temp directory, strip it
+    if dataset_path and file_path.startswith(dataset_path):
+        relative = file_path[len(dataset_path) :].lstrip("/")
+        return relative if relative else file_path
+
+    return file_path
+
+
+@lru_cache(maxsize=4096)
+def extract_path_from_message(msg, dataset_path):
+    """Try to heuristically extract a file path or filename from a validator message.
+
+    Cached because the same message text is typically reported for many files
+    across a cohort.
+    """
+    if not msg:
+        return None
+    # If message explicitly contains an absolute path
+    abs_path_match = _ABS_PATH_RE.search(msg)
+    if abs_path_match:
+        extracted = abs_path_match.group(1)
+        return strip_temp_path(extracted, dataset_path)
+    # dataset_description.json special case
+    if "dataset_description.json" in msg:
+        return "dataset_description.json"
+    # Look for sub-... filenames like sub-01_task-foo_blah.ext
+    name_match = _SUB_NAME_RE.search(msg)
+    if name_match:
+        return name_match.group(1)
+    # Generic filename with extension (e.g., task-recognition_stim.json)
+    generic_match = _GENERIC_NAME_RE.search(msg)
+    if generic_match:
+        return generic_match.group(1)
+    return None
+
+
+def strip_temp_path_from_message(msg):
+    """Remove temporary upload folder prefixes from message text"""
+    if not msg:
+        return msg
+    # Replace temp folder paths in the message with just the relative path
+    msg = _TEMP_DATASET_PATH_RE.sub(r"\2", msg)
+    # Also replace standalone temp paths that lead to sub- or ses- files
+    return _TEMP_SUBJECT_PATH_RE.sub(r"\2", msg)
 
 
 def format_validation_results(issues, dataset_stats, dataset_path):
@@ -284,72 +427,22 @@ def format_validation_results(issues, dataset_stats, dataset_path):
     error_groups = {}
     warning_groups = {}
 
+    # Flat issue lists and invalid paths are maintained alongside the groups
+    all_errors = []
+    all_warnings = []
     valid_files = []
     invalid_files = []
+    invalid_file_paths = set()
     file_paths = set()
 
-    def strip_temp_path(file_path):
-        """Strip temporary folder path prefix and keep only relative path from dataset root"""
-        if not file_path:
-            return None
-
-        # If it's a temp path, try to extract the relative path
-        if (
-            "/tmp/" in file_path
-            or "/T/prism_validator_" in file_path
-            or "/var/folders/" in file_path
-            or "prism_validator_" in file_path
-        ):
-            # Find the dataset root marker - typically after 'dataset/'
-            if "/dataset/" in file_path:
-                parts = file_path.split("/dataset/", 1)
-                if len(parts) > 1:
-                    return parts[1]
-
-            # Alternative: look for BIDS structure markers (sub-, dataset_description.json)
-            import re
-
-            match = re.search(r"((?:sub-|ses-|dataset_description\.json).*)", file_path)
-            if match:
-                return match.group(1)
-
-        # If dataset_path is a temp directory, strip it
-        if dataset_path and file_path.startswith(dataset_path):
-            relative = file_path[len(dataset_path) :].lstrip("/")
-            return relative if relative else file_path
-
-        return file_path
-
-    def extract_path_from_message(msg):
-        """Try to heuristically extract a file path or filename from a validator message."""
-        if not msg:
-            return None
-        # If message explicitly contains an absolute path
-        import re
-
-        abs_path_match = re.search(r"(/[^\s:,]+\.[A-Za-z0-9]+(?:\.gz)?)", msg)
-        if abs_path_match:
-            extracted = abs_path_match.group(1)
-            return strip_temp_path(extracted)
-        # dataset_description.json special case
-        if "dataset_description.json" in msg:
-            return "dataset_description.json"
-        # Look for sub-... filenames like sub-01_task-foo_blah.ext
-        name_match = re.search(r"(sub-[A-Za-z0-9._-]+\.[A-Za-z0-9]+(?:\.gz)?)", msg)
-        if name_match:
-            return name_match.group(1)
-        # Generic filename with extension (e.g., task-recognition_stim.json)
-        generic_match = re.search(
-            r"([A-Za-z0-9._\-]+\.(?:json|tsv|edf|nii|nii\.gz|txt|csv|mp4|png|jpg|jpeg))",
-            msg,
-        )
-        if generic_match:
-            return generic_match.group(1)
-        return None
-
     for issue in issues:
-        # Support tuples like (level, message) or (level, message, path)
-        if isinstance(issue, dict):
+        # Core validator issues are (level, message) pairs; unpack them directly
+        # and only fall back to shape checks for the rarer forms
+        if type(issue) is tuple and len(issue) == 2:
+            level, message = issue
+            file_path = None
+        # Support tuples like (level, message, path) and dict issues
+        elif isinstance(issue, dict):
             level = (
                 issue.get("type")
                 or issue.get("level")
@@ -359,11 +452,10 @@ def format_validation_results(issues, dataset_stats, dataset_path):
             message = issue.get("message", "")
             file_path = issue.get("file")
         elif isinstance(issue, (list, tuple)):
-            if len(issue) >= 2:
-                level, message = issue[0], issue[1]
-                file_path = issue[2] if len(issue) > 2 else None
-            else:
+            if len(issue) < 2:
                 continue
+            level, message = issue[0], issue[1]
+            file_path = issue[2] if len(issue) > 2 else None
         else:
             # Unknown shape: stringify
             level = "ERROR"
@@ -372,134 +464,98 @@ def format_validation_results(issues, dataset_stats, dataset_path):
 
         # Always strip temp path from file_path
         if not file_path:
-            file_path = extract_path_from_message(message)
-        file_path = strip_temp_path(file_path) if file_path else None
+            file_path = extract_path_from_message(message, dataset_path)
+        file_path = strip_temp_path(file_path, dataset_path) if file_path else None
 
         if file_path:
             file_paths.add(file_path)
 
         # Also strip temp path from message text itself
-        def strip_temp_path_from_message(msg):
-            if not msg:
-                return msg
-            import re
-
-            # Replace temp folder paths in the message with just the relative path
-            # Match various temp folder patterns: /tmp/, /T/, /var/folders/, prism_validator_
-            msg = re.sub(
-                r"(/tmp/[^\s,:]+/dataset/|/T/prism_validator_[^\s,:]+/dataset/|/var/folders/[^\s,:]+/dataset/|prism_validator_[^\s,:]+/dataset/)([^\s,:]+)",
-                r"\2",
-                msg,
-            )
-            # Also replace standalone temp paths that lead to sub- or ses- files
-            msg = re.sub(
-                r"(/tmp/[^\s,:]+/|/var/folders/[^\s,:]+/)(sub-[^\s,:/]+)", r"\2", msg
-            )
-            return msg
-
         message = strip_temp_path_from_message(message)
 
         # Extract error code from message if possible
         error_code = "GENERAL_ERROR"
-        if (
-            "Invalid BIDS filename" in message
-            or "Invalid BIDS filename format" in message
-        ):
+        if "Invalid BIDS filename" in message:
             error_code = "INVALID_BIDS_FILENAME"
-        elif "Missing sidecar" in message or "Missing sidecar for" in message:
+        elif "Missing sidecar" in message:
             error_code = "MISSING_SIDECAR"
         elif "schema error" in message:
             error_code = "SCHEMA_VALIDATION_ERROR"
-        elif "not valid JSON" in message or "is not valid JSON" in message:
+        elif "not valid JSON" in message:
             error_code = "INVALID_JSON"
-        elif (
-            "doesn't match expected pattern" in message
-            or "doesn't match expected pattern" in message
-        ):
+        elif "doesn't match expected pattern" in message:
             error_code = "FILENAME_PATTERN_MISMATCH"
 
-        formatted_issue = {
-            "code": error_code,
-            "message": message,
-            "file": file_path,
-            "level": level,
-        }
+        formatted_issue = FormattedIssue(error_code, message, file_path, level)
 
         if level == "ERROR":
-            if error_code not in error_groups:
-                error_groups[error_code] = {
-                    "code": error_code,
-                    "description": get_error_description(error_code),
-                    "files": [],
-                    "count": 0,
-                }
-            error_groups[error_code]["files"].append(formatted_issue)
-            error_groups[error_code]["count"] += 1
-
+            groups, flat_list = error_groups, all_errors
             if file_path:
                 invalid_files.append({"path": file_path, "errors": [message]})
-
+                invalid_file_paths.add(file_path)
         elif level == "WARNING":
-            if error_code not in warning_groups:
-                warning_groups[error_code] = {
-                    "code": error_code,
-                    "description": get_error_description(error_code),
-                    "files": [],
-                    "count": 0,
-                }
-            warning_groups[error_code]["files"].append(formatted_issue)
-            warning_groups[error_code]["count"] += 1
-
+            groups, flat_list = warning_groups, all_warnings
             if file_path:
-                valid_files.append(
-                    {"path": file_path}
-                )  # Warnings don't make files invalid
+                # Warnings don't make files invalid
+                valid_files.append({"path": file_path})
         else:
             # Treat other levels as info/valid
+            groups = flat_list = None
             if file_path:
                 valid_files.append({"path": file_path})
 
+        if groups is not None:
+            group = groups.get(error_code)
+            if group is None:
+                group = groups[error_code] = {
+                    "code": error_code,
+                    "description": get_error_description(error_code),
+                    "files": [],
+                    "count": 0,
+                }
+            group["files"].append(formatted_issue)
+            group["count"] += 1
+            flat_list.append(formatted_issue)
+
     # If we don't have file paths from issues, prefer dataset_stats total
     try:
         stats_total = getattr(dataset_stats, "total_files", 0)
     except Exception:
         stats_total = 0
 
-    # Prefer authoritative dataset_stats.total_files when available so counts align
-    if stats_total:
-        total_files = stats_total
-    else:
-        total_files = (
-            len(file_paths) if file_paths else len(valid_files) + len(invalid_files)
-        )
+    # Prefer authoritative dataset_stats.total_files when available so counts
+    # align; otherwise count the distinct paths seen in issues
+    total_files = stats_total or len(file_paths)
 
     # Add error if no files found
     if stats_total == 0 and len(file_paths) == 0:
         # Add a specific error for empty dataset
         error_code = "EMPTY_DATASET"
-        if error_code not in error_groups:
-            error_groups[error_code] = {
+        group = error_groups.setdefault(
+            error_code,
+            {
                 "code": error_code,
                 "description": "Dataset contains no data files",
                 "files": [],
                 "count": 0,
-            }
+            },
+        )
 
-        empty_dataset_issue = {
-            "code": error_code,
-            "message": "No data files found in dataset. Dataset may be empty or all files were filtered out as system files.",
-            "file": dataset_path,
-            "level": "ERROR",
-        }
-        error_groups[error_code]["files"].append(empty_dataset_issue)
-        error_groups[error_code]["count"] += 1
+        empty_dataset_issue = FormattedIssue(
+            error_code,
+            "No data files found in dataset. Dataset may be empty or all files were filtered out as system files.",
+            dataset_path,
+            "ERROR",
+        )
+        group["files"].append(empty_dataset_issue)
+        group["count"] += 1
+        all_errors.append(empty_dataset_issue)
 
     # Calculate summary
-    total_errors = sum(group["count"] for group in error_groups.values())
-    total_warnings = sum(group["count"] for group in warning_groups.values())
+    total_errors = len(all_errors)
+    total_warnings = len(all_warnings)
 
     # Count valid vs invalid files
-    invalid_file_paths = {f["path"] for f in invalid_files if f.get("path")}
     invalid_count = len(invalid_file_paths)
     # If we have dataset total, infer valid_count
     if stats_total:
@@ -523,45 +579,48 @@ def format_validation_results(issues, dataset_stats, dataset_path):
         "warning_groups": warning_groups,
         "valid_files": valid_files,
         "invalid_files": invalid_files,
-        "errors": [item for group in error_groups.values() for item in group["files"]],
-        "warnings": [
-            item for group in warning_groups.values() for item in group["files"]
-        ],
+        "errors": all_errors,
+        "warnings": all_warnings,
         "dataset_path": dataset_path,
         "dataset_stats": dataset_stats,
     }
 
 
+# User-friendly descriptions for error codes
+_ERROR_DESCRIPTIONS = {
+    "INVALID_BIDS_FILENAME": "Filenames must follow BIDS naming convention (sub-<label>_[ses-<label>_]...)",
+    "MISSING_SIDECAR": "Required JSON sidecar files are missing for data files",
+    "SCHEMA_VALIDATION_ERROR": "JSON sidecar content does not match required schema",
+    "INVALID_JSON": "JSON files contain syntax errors or are not valid JSON",
+    "FILENAME_PATTERN_MISMATCH": "Filenames do not match expected patterns for their modality",
+    "EMPTY_DATASET": "Dataset contains no data files or all files were filtered as system files",
+    "GENERAL_ERROR": "General validation error",
+}
+
+
 def get_error_description(error_code):
     """Get user-friendly descriptions for error codes"""
-    descriptions = {
-        "INVALID_BIDS_FILENAME": "Filenames must follow BIDS naming convention (sub-<label>_[ses-<label>_]...)",
-        "MISSING_SIDECAR": "Required JSON sidecar files are missing for data files",
-        "SCHEMA_VALIDATION_ERROR": "JSON sidecar content does not match required schema",
-        "INVALID_JSON": "JSON files contain syntax errors or are not valid JSON",
-        "FILENAME_PATTERN_MISMATCH": "Filenames do not match expected patterns for their modality",
-        "EMPTY_DATASET": "Dataset contains no data files or all files were filtered as system files",
-        "GENERAL_ERROR": "General validation error",
-    }
-    return descriptions.get(error_code, "Validation error")
+    return _ERROR_DESCRIPTIONS.get(error_code, "Validation error")
+
+
+_DOC_BASE_URL = (
+    "https://github.com/MRI-Lab-Graz/prism-validator/blob/main/docs/ERROR_CODES.md"
+)
+
+# Documentation anchors for error codes
+_DOC_ANCHORS = {
+    "INVALID_BIDS_FILENAME": f"{_DOC_BASE_URL}#invalid_bids_filename",
+    "MISSING_SIDECAR": f"{_DOC_BASE_URL}#missing_sidecar",
+    "SCHEMA_VALIDATION_ERROR": f"{_DOC_BASE_URL}#schema_validation_error",
+    "INVALID_JSON": f"{_DOC_BASE_URL}#invalid_json",
+    "FILENAME_PATTERN_MISMATCH": f"{_DOC_BASE_URL}#filename_pattern_mismatch",
+    "GENERAL_ERROR": _DOC_BASE_URL,
+}
 
 
 def get_error_documentation_url(error_code):
     """Get documentation URL for an error code"""
-    # Map error codes to documentation anchors
-    base_url = (
-        "https://github.com/MRI-Lab-Graz/prism-validator/blob/main/docs/ERROR_CODES.md"
-    )
-
-    doc_anchors = {
-        "INVALID_BIDS_FILENAME": f"{base_url}#invalid_bids_filename",
-        "MISSING_SIDECAR": f"{base_url}#missing_sidecar",
-        "SCHEMA_VALIDATION_ERROR": f"{base_url}#schema_validation_error",
-        "INVALID_JSON": f"{base_url}#invalid_json",
-        "FILENAME_PATTERN_MISMATCH": f"{base_url}#filename_pattern_mismatch",
-        "GENERAL_ERROR": base_url,
-    }
-    return doc_anchors.get(error_code, base_url)
+    return _DOC_ANCHORS.get(error_code, _DOC_BASE_URL)
 
 
 @lru_cache(maxsize=8)
@@ -741,6 +800,171 @@ def neurobagel_participants():
     )
 
 
+def _json_default(obj):
+    """Serialize objects the json module can't handle (sets, stats objects)"""
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=str)
+    if is_dataclass(obj):
+        return asdict(obj)
+    if hasattr(obj, "__dict__"):
+        return vars(obj)
+    return str(obj)
+
+
+def dumps_json_bytes(obj, indent=False):
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option, default=_json_default)
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        ensure_ascii=False,
+        default=_json_default,
+    ).encode("utf-8")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes with orjson when it is installed.
+
+    Falls back to the stdlib provider without orjson, or when a caller passes
+    json.dumps-specific keyword arguments.
+    """
+
+    @staticmethod
+    def default(obj):
+        # Sets and plain objects (e.g. dataset stats) are app-specific; other
+        # types such as dates, decimals and UUIDs keep Flask's own encoding
+        if isinstance(obj, (set, frozenset)) or (
+            hasattr(obj, "__dict__") and not is_dataclass(obj)
+        ):
+            return _json_default(obj)
+        return DefaultJSONProvider.default(obj)
+
+    def _orjson_option(self, indent=False):
+        # Pass dates through to default() so they match the stdlib path
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(
+            obj, option=self._orjson_option(), default=self.default
+        ).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        payload = orjson.dumps(
+            obj, option=self._orjson_option(indent), default=self.default
+        )
+        return self._app.response_class(payload + b"\n", mimetype=self.mimetype)
+
+
+app.json = OrjsonProvider(app)
+
+
+def _iter_orjson_pieces(obj, level=0):
+    """Yield obj as indented orjson bytes, one dict value or list item at a time
+
+    Only a single item's JSON is held in memory at once; the joined output is
+    identical to dumps_json_bytes(obj, indent=True).
+    """
+    if type(obj) is dict and obj and all(type(key) is str for key in obj):
+        newline = b"\n" + b"  " * (level + 1)
+        separator = b"{"
+        for key, value in obj.items():
+            yield separator + newline + orjson.dumps(key) + b": "
+            yield from _iter_orjson_pieces(value, level + 1)
+            separator = b","
+        yield b"\n" + b"  " * level + b"}"
+    elif type(obj) in (list, tuple) and obj:
+        newline = b"\n" + b"  " * (level + 1)
+        separator = b"["
+        for item in obj:
+            yield separator + newline
+            # Items are small (issues, file entries), so encode each whole
+            yield _reindent(dumps_json_bytes(item, indent=True), level + 1)
+            separator = b","
+        yield b"\n" + b"  " * level + b"]"
+    else:
+        yield _reindent(dumps_json_bytes(obj, indent=True), level)
+
+
+def _reindent(encoded, level):
+    """Shift the continuation lines of indented JSON bytes by level steps"""
+    if level and b"\n" in encoded:
+        return encoded.replace(b"\n", b"\n" + b"  " * level)
+    return encoded
+
+
+def iter_json_chunks(obj, chunk_size=64 * 1024):
+    """Yield obj as indented UTF-8 JSON in chunks of roughly chunk_size bytes.
+
+    Both encoders stream the document, so the full text never has to be held
+    in memory; orjson encodes it item by item, the stdlib encoder piece by piece.
+    """
+    if orjson is not None:
+        pieces = _iter_orjson_pieces(obj)
+    else:
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False, default=_json_default)
+        pieces = (piece.encode("utf-8") for piece in encoder.iterencode(obj))
+
+    buffered = []
+    buffered_size = 0
+    for piece in pieces:
+        buffered.append(piece)
+        buffered_size += len(piece)
+        if buffered_size >= chunk_size:
+            yield b"".join(buffered)
+            buffered = []
+            buffered_size = 0
+    if buffered:
+        yield b"".join(buffered)
+
+
+def gzip_chunks(chunks, compresslevel=1):
+    """Gzip-compress a stream of byte chunks incrementally"""
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def set_attachment_filename(response, download_name):
+    """Set Content-Disposition the way send_file does for download_name
+
+    Non-ASCII names get an ASCII fallback plus an RFC 5987 filename* value, as
+    HTTP headers themselves must stay latin-1 encodable.
+    """
+    try:
+        download_name.encode("ascii")
+    except UnicodeEncodeError:
+        simple = unicodedata.normalize("NFKD", download_name)
+        simple = simple.encode("ascii", "ignore").decode("ascii")
+        quoted = quote(download_name, safe="!#$&+-.^_`|~")
+        names = {"filename": simple, "filename*": f"UTF-8''{quoted}"}
+    else:
+        names = {"filename": download_name}
+    response.headers.set("Content-Disposition", "attachment", **names)
+
+
 def shorten_path(file_path, max_parts=3):
     """Shorten a file path to show only the last N parts with ellipsis"""
     if not file_path:
@@ -760,8 +984,89 @@ def get_filename_from_path(file_path):
     return os.path.basename(file_path)
 
 
-# Global storage for validation results
-validation_results = {}
+class ResultStore(OrderedDict):
+    """Bounded LRU store for validation results with optional expiry.
+
+    Entries not accessed for ``ttl`` seconds expire, and when the capacity is
+    exceeded the least recently used entry is evicted. Either way the entry's
+    temporary upload directory is removed. Every access reorders the store, so
+    all operations hold a lock to stay safe under a threaded server.
+    """
+
+    def __init__(self, capacity, ttl=None):
+        self.capacity = capacity
+        self.ttl = ttl
+        self._last_used = {}
+        self._lock = threading.RLock()
+        super().__init__()
+
+    def _touch(self, key):
+        self.move_to_end(key)
+        self._last_used[key] = time.monotonic()
+
+    def _evict(self, key):
+        evicted = super().pop(key)
+        self._last_used.pop(key, None)
+        temp_dir = evicted.get("temp_dir")
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def expire(self):
+        """Drop entries idle for longer than the TTL (oldest are at the front)"""
+        if self.ttl is None:
+            return
+        with self._lock:
+            cutoff = time.monotonic() - self.ttl
+            while self:
+                oldest = next(iter(self))
+                if self._last_used.get(oldest, cutoff) > cutoff:
+                    break
+                self._evict(oldest)
+
+    def __contains__(self, key):
+        with self._lock:
+            self.expire()
+            return super().__contains__(key)
+
+    def __getitem__(self, key):
+        with self._lock:
+            self.expire()
+            value = super().__getitem__(key)
+            self._touch(key)
+            return value
+
+    def get(self, key, default=None):
+        """Return the entry for key (marking it used), or default"""
+        with self._lock:
+            try:
+                return self[key]
+            except KeyError:
+                return default
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self._touch(key)
+            self.expire()
+            while len(self) > self.capacity:
+                self._evict(next(iter(self)))
+
+    def __delitem__(self, key):
+        with self._lock:
+            super().__delitem__(key)
+            self._last_used.pop(key, None)
+
+    def pop(self, key, *default):
+        """Remove and return the entry for key without touching its files"""
+        with self._lock:
+            self._last_used.pop(key, None)
+            return super().pop(key, *default)
+
+
+# Global storage for validation results (in production, use a database)
+MAX_STORED_RESULTS = 64
+RESULT_TTL_SECONDS = 60 * 60
+validation_results = ResultStore(MAX_STORED_RESULTS, ttl=RESULT_TTL_SECONDS)
 
 
 @app.route("/")
@@ -789,28 +1094,46 @@ def validate_dataset():
 
 @app.route("/upload", methods=["POST"])
 def upload_dataset():
-    """Handle dataset upload and validation"""
-    if "dataset" not in request.files:
-        flash("No dataset uploaded", "error")
-        return redirect(url_for("index"))
+    """Handle dataset upload and validation
 
-    files = request.files.getlist("dataset")
-    if not files or (len(files) == 1 and files[0].filename == ""):
-        flash("No files selected", "error")
-        return redirect(url_for("index"))
+    Besides multipart form uploads, a ZIP archive can be posted as the raw
+    request body (Content-Type: application/zip), with filename and
+    schema_version passed as query parameters. The body is then spooled
+    straight from the request stream without multipart parsing, and is always
+    treated as a ZIP archive whatever the filename.
+    """
+    raw_zip = request.mimetype in ZIP_MIMETYPES
+    if raw_zip:
+        files = [
+            FileStorage(
+                request.stream, filename=request.args.get("filename", "dataset.zip")
+            )
+        ]
+        form = request.args
+    else:
+        if "dataset" not in request.files:
+            flash("No dataset uploaded", "error")
+            return redirect(url_for("index"))
+
+        files = request.files.getlist("dataset")
+        if not files or (len(files) == 1 and files[0].filename == ""):
+            flash("No files selected", "error")
+            return redirect(url_for("index"))
+        form = request.form
 
     # Get schema version from form
-    schema_version = request.form.get("schema_version", "stable")
+    schema_version = form.get("schema_version", "stable")
 
     # Create temporary directory for processing
     temp_dir = tempfile.mkdtemp(prefix="prism_validator_")
 
-    metadata_paths = request.form.getlist("metadata_paths[]")
+    metadata_paths = form.getlist("metadata_paths[]")
+    skipped_files = None
 
     try:
         # Check if this is a folder upload (multiple files) or ZIP upload (single file)
-        if len(files) > 1 or (
-            len(files) == 1 and not files[0].filename.lower().endswith(".zip")
+        if not raw_zip and (
+            len(files) > 1 or not files[0].filename.lower().endswith(".zip")
         ):
             # Handle folder upload
             dataset_path = process_folder_upload(files, temp_dir, metadata_paths)
@@ -819,35 +1142,23 @@ def upload_dataset():
             # Handle ZIP upload
             file = files[0]
             filename = secure_filename(file.filename)
-            if not filename.lower().endswith(".zip"):
+            if not raw_zip and not filename.lower().endswith(".zip"):
                 flash("Please upload a ZIP file or select a folder", "error")
                 shutil.rmtree(temp_dir, ignore_errors=True)
                 return redirect(url_for("index"))
 
-            dataset_path = process_zip_upload(file, temp_dir, filename)
+            dataset_path, skipped_files = process_zip_upload(file, temp_dir)
 
-        # DEBUG: Print dataset_path and sample files (excluding system files)
         print(f"📁 [UPLOAD] Validating dataset at: {dataset_path}")
-        for root, dirs, files in os.walk(dataset_path):
-            # Filter out system files from debug output
-            try:
-                filtered_files = [f for f in files if not is_system_file(f)]
-            except NameError:
-                # Fallback filtering
-                filtered_files = [
-                    f
-                    for f in files
-                    if not (
-                        f.startswith(".")
-                        or f in ["Thumbs.db", "ehthumbs.db", "Desktop.ini"]
-                    )
-                ]
-
+        if app.debug:
+            # DEBUG: Print sample files at the dataset root (excluding system files)
+            with os.scandir(dataset_path) as entries:
+                files = [e.name for e in entries if e.is_file()]
+            filtered_files = [f for f in files if not is_system_file(f)]
             for file in filtered_files[:10]:
-                print(f"   {os.path.relpath(os.path.join(root, file), dataset_path)}")
+                print(f"   {file}")
             if len(files) != len(filtered_files):
                 print(f"   (+ {len(files) - len(filtered_files)} system files ignored)")
-            break
         # Validate the dataset using core validator when available
         if callable(core_validate_dataset):
             issues, dataset_stats = core_validate_dataset(
@@ -868,7 +1179,12 @@ def upload_dataset():
 
         # Check if manifest exists and add details
         manifest_path = os.path.join(dataset_path, ".upload_manifest.json")
-        if os.path.exists(manifest_path):
+        if skipped_files is not None:
+            results["upload_manifest"] = {
+                "placeholder_files": len(skipped_files),
+                "upload_mode": "DataLad-style (structure + metadata only)",
+            }
+        elif os.path.exists(manifest_path):
             with open(manifest_path, "r") as f:
                 manifest = json.load(f)
             results["upload_manifest"] = {
@@ -885,12 +1201,13 @@ def upload_dataset():
         print(f"   Total errors: {results['summary']['total_errors']}")
 
         # Store results globally (in production, use a database)
-        result_id = f"result_{len(validation_results)}"
+        result_id = uuid.uuid4().hex
         validation_results[result_id] = {
             "results": results,
             "dataset_path": dataset_path,
             "temp_dir": temp_dir,
             "filename": filename,
+            "display_stats": summarize_dataset_stats(dataset_stats),
         }
 
         return redirect(url_for("show_results", result_id=result_id))
@@ -907,47 +1224,57 @@ def upload_dataset():
         return redirect(url_for("index"))
 
 
-def create_placeholder_content(file_path, extension):
-    """Create informative placeholder content for data files (DataLad-style)"""
+# Human-readable descriptions for placeholder data files
+PLACEHOLDER_FILE_TYPES = {
+    ".nii": "NIfTI neuroimaging data",
+    ".nii.gz": "Compressed NIfTI neuroimaging data",
+    ".png": "PNG image stimulus",
+    ".jpg": "JPEG image stimulus",
+    ".jpeg": "JPEG image stimulus",
+    ".tiff": "TIFF image data",
+    ".mp4": "MP4 video stimulus",
+    ".avi": "AVI video data",
+    ".mov": "QuickTime video",
+    ".eeg": "EEG raw data",
+    ".dat": "Binary data file",
+    ".fif": "Neuromag/MNE data",
+    ".mat": "MATLAB data file",
+}
+
+
+def create_placeholder_content(file_path, extension, created=None):
+    """Create informative placeholder content for data files (DataLad-style)
+
+    Args:
+        file_path: Relative path of the file being replaced
+        extension: Lower-case file extension (e.g. '.nii.gz')
+        created: ISO timestamp to embed; pass one value for a whole upload
+            to avoid querying the clock per file
+    """
     filename = os.path.basename(file_path)
+    created = created or datetime.now().isoformat()
+    extension = extension.lower()
 
     # For JSON files, create valid JSON placeholders
-    if extension.lower() == ".json":
+    if extension == ".json":
         return json.dumps(
             {
                 "_placeholder": True,
                 "_upload_mode": "DataLad-style (structure + metadata only)",
                 "_original_filename": filename,
-                "_created": datetime.now().isoformat(),
+                "_created": created,
                 "_note": "This is a placeholder file. Original JSON was not uploaded to reduce transfer size.",
             },
             indent=2,
         )
 
     # For TSV files, create valid TSV placeholders
-    elif extension.lower() == ".tsv":
-        return f"# PLACEHOLDER TSV - DataLad-style Upload\n# Original filename: {filename}\n# Created: {datetime.now().isoformat()}\n_placeholder\ttrue\n"
+    elif extension == ".tsv":
+        return f"# PLACEHOLDER TSV - DataLad-style Upload\n# Original filename: {filename}\n# Created: {created}\n_placeholder\ttrue\n"
 
     # For other file types, use text placeholder
     else:
-        # Determine file type from extension
-        file_type_map = {
-            ".nii": "NIfTI neuroimaging data",
-            ".nii.gz": "Compressed NIfTI neuroimaging data",
-            ".png": "PNG image stimulus",
-            ".jpg": "JPEG image stimulus",
-            ".jpeg": "JPEG image stimulus",
-            ".tiff": "TIFF image data",
-            ".mp4": "MP4 video stimulus",
-            ".avi": "AVI video data",
-            ".mov": "QuickTime video",
-            ".eeg": "EEG raw data",
-            ".dat": "Binary data file",
-            ".fif": "Neuromag/MNE data",
-            ".mat": "MATLAB data file",
-        }
-
-        file_type = file_type_map.get(extension, f"{extension} data file")
+        file_type = PLACEHOLDER_FILE_TYPES.get(extension, f"{extension} data file")
 
         placeholder = f"""# PLACEHOLDER FILE - DataLad-style Upload
 # This is a placeholder for the original data file that was not uploaded
@@ -956,7 +1283,7 @@ def create_placeholder_content(file_path, extension):
 Original filename: {filename}
 File type: {file_type}
 Upload mode: Structure-only validation
-Created: {datetime.now().isoformat()}
+Created: {created}
 
 # The validator can still check:
 # - File naming conventions
@@ -1023,8 +1350,13 @@ def normalize_relative_path(path, prefix_to_strip):
         prefix = prefix_to_strip.strip("/")
         if cleaned.startswith(prefix + "/"):
             cleaned = cleaned[len(prefix) + 1 :]
-    normalized = os.path.normpath(cleaned)
-    normalized = normalized.replace("\\", "/")
+    # normpath only changes paths with empty, "." or ".." segments; skip it
+    # for the common already-clean path
+    bounded = f"/{cleaned}/"
+    if "//" in bounded or "/./" in bounded or "/../" in bounded:
+        normalized = os.path.normpath(cleaned).replace("\\", "/")
+    else:
+        normalized = cleaned
     if normalized in ("", "."):  # Directory only
         return None
     if normalized.startswith(".."):
@@ -1032,6 +1364,32 @@ def normalize_relative_path(path, prefix_to_strip):
     return normalized
 
 
+def get_file_extension(path):
+    """Return the extension of a '/'-separated path, treating .nii.gz as one"""
+    if path.endswith(".nii.gz"):
+        return ".nii.gz"
+    dot = path.rfind(".")
+    # Leading dots of hidden files (e.g. .bidsignore) are not extensions
+    return path[dot:] if dot > path.rfind("/") + 1 else ""
+
+
+def join_native_path(root, relative_path):
+    """Join a '/'-separated relative path onto root using the native separator"""
+    if _NATIVE_SEP != "/":
+        relative_path = relative_path.replace("/", _NATIVE_SEP)
+    return os.path.join(root, relative_path)
+
+
+def save_upload(file, file_path):
+    """Write an uploaded file to disk using large copy blocks.
+
+    FileStorage.save() copies in 16 KiB chunks; 1 MiB blocks cut the number
+    of Python-level read/write iterations for larger files.
+    """
+    with open(file_path, "wb") as out:
+        shutil.copyfileobj(file.stream, out, COPY_BUFFER_SIZE)
+
+
 def process_folder_upload(files, temp_dir, metadata_paths=None):
     """Process uploaded folder files and recreate directory structure (DataLad-style)
 
@@ -1055,20 +1413,30 @@ def process_folder_upload(files, temp_dir, metadata_paths=None):
     all_files_list = json.loads(all_files_json) if all_files_json else []
     metadata_paths = metadata_paths or []
 
-    candidate_paths = list(all_files_list or [])
+    # Uploaded paths normally also appear in all_files; de-duplicate them so
+    # each path is only split once when detecting the prefix
+    candidate_paths = dict.fromkeys(all_files_list or [])
     if metadata_paths:
-        candidate_paths.extend(metadata_paths)
+        candidate_paths.update(dict.fromkeys(metadata_paths))
     else:
-        candidate_paths.extend(
-            [f.filename for f in files if getattr(f, "filename", None)]
+        candidate_paths.update(
+            dict.fromkeys(f.filename for f in files if getattr(f, "filename", None))
         )
 
     prefix_to_strip = detect_dataset_prefix(candidate_paths)
     if prefix_to_strip:
         print(f"📁 [UPLOAD] Stripping leading folder: {prefix_to_strip}")
 
+    # Normalise each distinct path once for both the upload and placeholder passes
+    normalize = lru_cache(maxsize=None)(
+        lambda path: normalize_relative_path(path, prefix_to_strip)
+    )
+
     # Create a set of uploaded file paths for quick lookup
     uploaded_paths = set()
+    # Target path -> upload / placeholder text; written together further down
+    pending_saves = {}
+    pending_placeholders = {}
 
     if metadata_paths and len(metadata_paths) != len(files):
         print(
@@ -1083,7 +1451,7 @@ def process_folder_upload(files, temp_dir, metadata_paths=None):
         )
         if not original_path:
             continue
-        normalized_path = normalize_relative_path(original_path, prefix_to_strip)
+        normalized_path = normalize(original_path)
         if not normalized_path:
             continue
 
@@ -1104,11 +1472,8 @@ def process_folder_upload(files, temp_dir, metadata_paths=None):
                 continue
 
         uploaded_paths.add(normalized_path)
-        file_path = os.path.join(dataset_root, *normalized_path.split("/"))
-        target_dir = os.path.dirname(file_path)
-        if target_dir:
-            os.makedirs(target_dir, exist_ok=True)
-        file.save(file_path)
+        # Later duplicates replace earlier ones, as sequential saving would
+        pending_saves[join_native_path(dataset_root, normalized_path)] = file
         processed_count += 1
 
         manifest["uploaded_files"].append(
@@ -1121,7 +1486,7 @@ def process_folder_upload(files, temp_dir, metadata_paths=None):
 
     # Create smart placeholders for all files that weren't uploaded
     for relative_path in all_files_list:
-        normalized_path = normalize_relative_path(relative_path, prefix_to_strip)
+        normalized_path = normalize(relative_path)
         if not normalized_path or normalized_path in uploaded_paths:
             continue
 
@@ -1140,25 +1505,35 @@ def process_folder_upload(files, temp_dir, metadata_paths=None):
             if filename in ["Thumbs.db", "ehthumbs.db", "Desktop.ini"]:
                 continue
 
-        file_path = os.path.join(dataset_root, *normalized_path.split("/"))
-        target_dir = os.path.dirname(file_path)
-        if target_dir:
-            os.makedirs(target_dir, exist_ok=True)
-
-        lower_path = normalized_path.lower()
-        if lower_path.endswith(".nii.gz"):
-            ext = ".nii.gz"
-        else:
-            _, ext = os.path.splitext(lower_path)
-        placeholder_content = create_placeholder_content(normalized_path, ext)
-        with open(file_path, "w") as f:
-            f.write(placeholder_content)
+        file_path = join_native_path(dataset_root, normalized_path)
+        ext = get_file_extension(normalized_path.lower())
+        pending_placeholders[file_path] = create_placeholder_content(
+            normalized_path, ext, created=manifest["timestamp"]
+        )
         skipped_count += 1
 
         manifest["placeholder_files"].append(
             {"path": normalized_path, "extension": ext, "type": "placeholder"}
         )
 
+    # Create each target directory once, then write uploads and placeholders
+    # concurrently (I/O bound)
+    target_dirs = {os.path.dirname(path) for path in pending_saves}
+    target_dirs.update(os.path.dirname(path) for path in pending_placeholders)
+    for target_dir in target_dirs:
+        os.makedirs(target_dir, exist_ok=True)
+    if pending_saves or pending_placeholders:
+        with ThreadPoolExecutor(max_workers=UPLOAD_SAVE_WORKERS) as executor:
+            # Consume the iterators so worker exceptions propagate
+            list(executor.map(save_upload, pending_saves.values(), pending_saves))
+            list(
+                executor.map(
+                    write_placeholder,
+                    pending_placeholders,
+                    pending_placeholders.values(),
+                )
+            )
+
     # Save manifest file for debugging and transparency
     manifest_path = os.path.join(dataset_root, ".upload_manifest.json")
     with open(manifest_path, "w") as f:
@@ -1167,55 +1542,138 @@ def process_folder_upload(files, temp_dir, metadata_paths=None):
     print(
         f"📁 Processed {processed_count} metadata files, created {skipped_count} placeholders for data files"
     )
-    print("📁 [UPLOAD] File tree in temp_dir after upload:")
-    for root, dirs, files in os.walk(dataset_root):
-        for file in files:
-            rel_path = os.path.relpath(os.path.join(root, file), dataset_root)
-            print(f"   {rel_path}")
+    # List what was written from the manifest rather than walking the tree again
+    written_paths = [
+        entry["path"]
+        for entry in manifest["uploaded_files"] + manifest["placeholder_files"]
+    ]
+    shown_paths = written_paths if app.debug else written_paths[:10]
+    print("📁 [UPLOAD] Files written to temp_dir:")
+    for rel_path in shown_paths:
+        print(f"   {rel_path}")
+    if len(shown_paths) < len(written_paths):
+        print(f"   (+ {len(written_paths) - len(shown_paths)} more)")
     return dataset_root
 
 
-def process_zip_upload(file, temp_dir, filename):
+def write_placeholder(file_path, content):
+    """Write placeholder text for a data file that was not uploaded"""
+    with open(file_path, "w") as f:
+        f.write(content)
+
+
+def _link_placeholder(template_path, target_path):
+    """Create an empty placeholder by hardlinking a shared zero-byte template"""
+    try:
+        os.link(template_path, target_path)
+    except OSError:
+        # Filesystem without hardlink support: fall back to a plain empty file
+        open(target_path, "wb").close()
+
+
+def zip_member_target(temp_dir, member_name):
+    """Return the extraction path of a ZIP member inside temp_dir.
+
+    Drive letters, absolute prefixes and parent references are removed the
+    same way ZipFile.extract does; None is returned for members that would
+    land outside temp_dir.
+    """
+    relative_path = normalize_relative_path(os.path.splitdrive(member_name)[1], None)
+    return join_native_path(temp_dir, relative_path) if relative_path else None
+
+
+def open_upload_stream(file, temp_dir):
+    """Return a seekable binary stream for an uploaded file without saving it.
+
+    Werkzeug already buffers uploads in a seekable stream, which is used as-is.
+    Otherwise the data is copied into a SpooledTemporaryFile that stays in
+    memory for small uploads and rolls over to temp_dir for large ones.
+    """
+    stream = file.stream
+    try:
+        stream.seek(0)
+        return stream
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        pass
+
+    spooled = tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_SIZE, dir=temp_dir)
+    shutil.copyfileobj(stream, spooled, COPY_BUFFER_SIZE)
+    spooled.seek(0)
+    return spooled
+
+
+def process_zip_upload(file, temp_dir):
     """Process uploaded ZIP file
 
     Extracts only metadata files from ZIP to reduce processing time and storage.
+    Large data files are represented by empty placeholders that all share one
+    zero-byte template inode, so no per-file content is ever written.
+
+    Returns:
+        tuple: (dataset_root, skipped_files) where skipped_files lists the
+        archive members that were replaced by placeholders
     """
-    file_path = os.path.join(temp_dir, filename)
-    file.save(file_path)
+    archive = open_upload_stream(file, temp_dir)
 
     processed_count = 0
-    skipped_count = 0
+    skipped_files = []
+    # Created next to temp_dir (same filesystem, so hardlinks work) rather than
+    # inside it, so the template never appears in the extracted dataset
+    fd, placeholder_template = tempfile.mkstemp(
+        prefix="prism_placeholder_", dir=os.path.dirname(temp_dir)
+    )
+    os.close(fd)
+    # Directories already created, so each one costs a single makedirs call
+    created_dirs = {temp_dir}
 
     # Extract ZIP file selectively
-    with zipfile.ZipFile(file_path, "r") as zip_ref:
-        for zip_info in zip_ref.namelist():
-            # Skip directories
-            if zip_info.endswith("/"):
-                continue
-
-            # Check file extension
-            _, ext = os.path.splitext(zip_info.lower())
-            if ext == ".gz" and zip_info.lower().endswith(".nii.gz"):
-                ext = ".nii.gz"
-
-            # Extract metadata files, skip large data files
-            if ext in METADATA_EXTENSIONS or ext == "":
-                zip_ref.extract(zip_info, temp_dir)
-                processed_count += 1
-            elif ext in SKIP_EXTENSIONS:
-                # Create empty placeholder
-                extract_path = os.path.join(temp_dir, zip_info)
-                os.makedirs(os.path.dirname(extract_path), exist_ok=True)
-                with open(extract_path, "w") as f:
-                    f.write("")
-                skipped_count += 1
+    try:
+        with zipfile.ZipFile(archive, "r") as zip_ref:
+            for zip_info in zip_ref.infolist():
+                # Skip directories
+                if zip_info.is_dir():
+                    continue
+                member_name = zip_info.filename
+
+                # Extract metadata files (and files without extension),
+                # replace large data files with placeholders
+                name = member_name.lower()
+                if name.endswith(_METADATA_SUFFIXES):
+                    extract = True
+                elif name.endswith(_SKIP_SUFFIXES):
+                    extract = False
+                elif get_file_extension(name) == "":
+                    extract = True
+                else:
+                    continue
+                extract_path = zip_member_target(temp_dir, member_name)
+                if extract_path is None:
+                    continue
+                target_dir = os.path.dirname(extract_path)
+                if target_dir not in created_dirs:
+                    os.makedirs(target_dir, exist_ok=True)
+                    created_dirs.add(target_dir)
+                if extract:
+                    with zip_ref.open(zip_info) as src, open(extract_path, "wb") as dst:
+                        shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+                    processed_count += 1
+                else:
+                    # Create empty placeholder
+                    _link_placeholder(placeholder_template, extract_path)
+                    skipped_files.append(member_name)
+    finally:
+        # Release our own spool (and any rollover file) as soon as we are done
+        if archive is not file.stream:
+            archive.close()
+        # Placeholders keep the shared inode alive after the template is gone
+        os.unlink(placeholder_template)
 
     print(
-        f"📦 Extracted {processed_count} metadata files, skipped {skipped_count} data files from ZIP"
+        f"📦 Extracted {processed_count} metadata files, skipped {len(skipped_files)} data files from ZIP"
     )
 
     # Find the actual dataset directory (might be nested)
-    return find_dataset_root(temp_dir)
+    return find_dataset_root(temp_dir), skipped_files
 
 
 @app.route("/validate_folder", methods=["POST"])
@@ -1242,12 +1700,6 @@ def validate_folder():
         # Print validation start info to terminal
         print(f"\n📁 [VALIDATE_FOLDER] Validating local directory: {folder_path}")
 
-        # Count files for debug output
-        file_count = 0
-        for root, dirs, files in os.walk(folder_path):
-            file_count += len([f for f in files if not is_system_file(f)])
-        print(f"   Found {file_count} non-system files in directory")
-
         # Use the core validator when available for direct integration
         if callable(core_validate_dataset):
             issues, stats = core_validate_dataset(
@@ -1271,12 +1723,13 @@ def validate_folder():
         print(f"   Warnings: {formatted_results['summary']['total_warnings']}")
 
         # Store results
-        result_id = f"result_{len(validation_results)}"
+        result_id = uuid.uuid4().hex
         validation_results[result_id] = {
             "results": formatted_results,
             "dataset_path": folder_path,
             "temp_dir": None,  # No temp dir for local folders
             "filename": os.path.basename(folder_path),
+            "display_stats": summarize_dataset_stats(stats),
         }
 
         return redirect(url_for("show_results", result_id=result_id))
@@ -1286,46 +1739,51 @@ def validate_folder():
         return redirect(url_for("index"))
 
 
+def summarize_dataset_stats(stats_obj):
+    """Derive the dataset statistics shown on the results page.
+
+    Computed once when a result is stored so repeated views don't redo the work.
+    """
+    if not stats_obj:
+        return None
+    try:
+        session_entries = getattr(stats_obj, "sessions", set()) or set()
+        unique_sessions = set()
+        for entry in session_entries:
+            if isinstance(entry, str) and "/" in entry:
+                unique_sessions.add(entry.split("/", 1)[1])
+            elif entry:
+                unique_sessions.add(entry)
+
+        return {
+            "total_subjects": len(getattr(stats_obj, "subjects", [])),
+            "total_sessions": len(unique_sessions),
+            "modalities": getattr(stats_obj, "modalities", {}),
+            "tasks": sorted(getattr(stats_obj, "tasks", [])),
+            "total_files": getattr(stats_obj, "total_files", 0),
+            "sidecar_files": getattr(stats_obj, "sidecar_files", 0),
+        }
+    except Exception as stats_error:
+        print(f"⚠️  Failed to prepare dataset stats for display: {stats_error}")
+        return None
+
+
 @app.route("/results/<result_id>")
 def show_results(result_id):
     """Display validation results"""
-    if result_id not in validation_results:
+    data = validation_results.get(result_id)
+    if data is None:
         flash("Results not found", "error")
         return redirect(url_for("index"))
 
-    data = validation_results[result_id]
     results = data["results"]
 
-    # Get dataset stats if available
-    dataset_stats = None
-    stats_obj = results.get("dataset_stats")
-    if stats_obj:
-        try:
-            session_entries = getattr(stats_obj, "sessions", set()) or set()
-            unique_sessions = set()
-            for entry in session_entries:
-                if isinstance(entry, str) and "/" in entry:
-                    unique_sessions.add(entry.split("/", 1)[1])
-                elif entry:
-                    unique_sessions.add(entry)
-
-            dataset_stats = {
-                "total_subjects": len(getattr(stats_obj, "subjects", [])),
-                "total_sessions": len(unique_sessions),
-                "modalities": getattr(stats_obj, "modalities", {}),
-                "tasks": sorted(getattr(stats_obj, "tasks", [])),
-                "total_files": getattr(stats_obj, "total_files", 0),
-                "sidecar_files": getattr(stats_obj, "sidecar_files", 0),
-            }
-        except Exception as stats_error:
-            print(f"⚠️  Failed to prepare dataset stats for display: {stats_error}")
-
     return render_template(
         "results.html",
         results=results,
         result_id=result_id,
         filename=data["filename"],
-        dataset_stats=dataset_stats,
+        dataset_stats=data.get("display_stats"),
         shorten_path=shorten_path,
         get_filename_from_path=get_filename_from_path,
         get_error_documentation_url=get_error_documentation_url,
@@ -1335,11 +1793,11 @@ def show_results(result_id):
 @app.route("/download_report/<result_id>")
 def download_report(result_id):
     """Download validation report as JSON"""
-    if result_id not in validation_results:
+    data = validation_results.get(result_id)
+    if data is None:
         flash("Results not found", "error")
         return redirect(url_for("index"))
 
-    data = validation_results[result_id]
     results = data["results"]
 
     # Create JSON report
@@ -1357,27 +1815,32 @@ def download_report(result_id):
         "results": results,
     }
 
-    # Create in-memory file
-    output = io.BytesIO()
-    output.write(json.dumps(report, indent=2).encode("utf-8"))
-    output.seek(0)
+    body = iter_json_chunks(report)
 
-    return send_file(
-        output,
-        mimetype="application/json",
-        as_attachment=True,
-        download_name=f'validation_report_{data["filename"]}.json',
-    )
+    # Reports are highly repetitive JSON; compress in fast mode when accepted
+    if request.accept_encodings["gzip"] > 0:
+        body = gzip_chunks(body)
+        headers = {"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+        etag = f"{result_id}-gzip"
+    else:
+        headers = {"Vary": "Accept-Encoding"}
+        etag = result_id
+
+    response = Response(body, mimetype="application/json", headers=headers)
+    set_attachment_filename(response, f"validation_report_{data['filename']}.json")
+    # Stored results never change, so the result id identifies the report;
+    # repeat downloads get a 304 before the lazy body is ever serialized
+    response.set_etag(etag)
+    return response.make_conditional(request)
 
 
 @app.route("/cleanup/<result_id>")
 def cleanup(result_id):
     """Clean up temporary files"""
-    if result_id in validation_results:
-        data = validation_results[result_id]
+    data = validation_results.pop(result_id, None)
+    if data is not None:
         if data["temp_dir"] and os.path.exists(data["temp_dir"]):
             shutil.rmtree(data["temp_dir"], ignore_errors=True)
-        del validation_results[result_id]
 
     flash("Results cleaned up", "success")
     return redirect(url_for("index"))
@@ -1406,14 +1869,32 @@ def api_validate():
 
 
 def find_dataset_root(extract_dir):
-    """Find the actual dataset root directory after extraction"""
-    # Look for dataset_description.json or typical BIDS structure
-    for root, dirs, files in os.walk(extract_dir):
-        if "dataset_description.json" in files:
-            return root
-        # Look for subject directories
-        if any(d.startswith("sub-") for d in dirs):
-            return root
+    """Find the actual dataset root directory after extraction
+
+    Searches breadth-first, so the shallowest directory containing
+    dataset_description.json or sub-* folders wins. Each directory is listed
+    once with os.scandir and the search stops at the first match.
+    """
+    queue = deque([extract_dir])
+    while queue:
+        directory = queue.popleft()
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name == "dataset_description.json" and entry.is_file():
+                        return directory
+                    if entry.is_dir():
+                        # Look for subject directories
+                        if entry.name.startswith("sub-"):
+                            return directory
+                        if not entry.is_symlink():
+                            subdirs.append(entry)
+        except OSError:
+            continue
+        # Visit regular folders before hidden ones (e.g. .git), in name order
+        subdirs.sort(key=lambda entry: (entry.name.startswith("."), entry.name))
+        queue.extend(entry.path for entry in subdirs)
 
     # If no clear dataset structure, return the extraction directory
     return extract_dir
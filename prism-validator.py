@@ -81,6 +81,13 @@ Examples:
         action="store_true",
         help="Run the standard BIDS validator in addition to PRISM validation",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        metavar="N",
+        help="Validate subjects in N parallel worker processes",
+    )
     parser.add_argument("--version", action="version", version="Prism-Validator 1.3.0")
 
     args = parser.parse_args()
@@ -124,6 +131,7 @@ Examples:
             verbose=args.verbose,
             schema_version=schema_version,
             run_bids=args.bids,
+            jobs=args.jobs,
         )
 
         # Print results
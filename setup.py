@@ -39,6 +39,7 @@ setup(
         "dev": ["pytest", "pytest-cov", "black", "flake8"],
         "full": ["bidsschematools", "nibabel"],
         "demo": ["Pillow", "numpy", "matplotlib"],
+        "fast": ["orjson"],
     },
     scripts=[
         "prism-validator.py",
@@ -50,11 +51,10 @@ setup(
         "Topic :: Scientific/Engineering",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.9",
     keywords="bids validation psychology neuroscience research data",
 )
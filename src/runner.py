@@ -5,14 +5,22 @@ without executing the top-level CLI script.
 """
 
 import os
+import re
 import sys
 import subprocess
 import json
+from concurrent.futures import ProcessPoolExecutor
 
 from schema_manager import load_all_schemas
-from validator import DatasetValidator, MODALITY_PATTERNS, resolve_sidecar_path
+from validator import (
+    DatasetValidator,
+    MODALITY_PATTERNS,
+    resolve_sidecar_path,
+    merge_schema_results,
+    schema_results_snapshot,
+)
 from stats import DatasetStats
-from system_files import filter_system_files
+from system_files import is_system_file, scan_dir_filtered
 from bids_integration import check_and_update_bidsignore
 
 # Add current directory to path for imports
@@ -21,7 +29,42 @@ if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
 
-def validate_dataset(root_dir, verbose=False, schema_version=None, run_bids=False):
+_TASK_RE = re.compile(r"_task-([A-Za-z0-9]+)(?:_|$)")
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "schemas")
+
+# Per-process validator used by subject shards in worker processes
+_worker_validator = None
+
+
+def _init_worker(schema_version, schema_results):
+    """Load schemas and seed the parent's schema check cache once per worker"""
+    global _worker_validator
+    merge_schema_results(schema_results)
+    _worker_validator = DatasetValidator(
+        load_all_schemas(SCHEMA_DIR, version=schema_version)
+    )
+
+
+def _validate_subject_shard(shard):
+    """Validate one subject in a worker process
+
+    Returns (issues, stats, schema_results), the latter being the schema check
+    outcomes computed for this subject so the parent can cache them.
+    """
+    subject_dir, subject_id, root_dir = shard
+    stats = DatasetStats()
+    issues = _validate_subject(
+        subject_dir, subject_id, _worker_validator, stats, root_dir
+    )
+    schema_results = _worker_validator.computed_schema_results
+    _worker_validator.computed_schema_results = []
+    return issues, stats, schema_results
+
+
+def validate_dataset(
+    root_dir, verbose=False, schema_version=None, run_bids=False, jobs=None
+):
     """Main dataset validation function (refactored from prism-validator.py)
 
     Args:
@@ -29,6 +72,10 @@ def validate_dataset(root_dir, verbose=False, schema_version=None, run_bids=Fals
         verbose: Enable verbose output
         schema_version: Schema version to use (e.g., 'stable', 'v0.1', '0.1')
         run_bids: Whether to run the standard BIDS validator
+        jobs: Number of worker processes for subject validation (default: serial).
+            Workers use the default multiprocessing start method, so only pass
+            this from single-threaded entry points such as the CLI, not from
+            the threaded web server.
 
     Returns: (issues, stats)
     """
@@ -36,7 +83,7 @@ def validate_dataset(root_dir, verbose=False, schema_version=None, run_bids=Fals
     stats = DatasetStats()
 
     # Load schemas with specified version
-    schema_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "schemas")
+    schema_dir = SCHEMA_DIR
     schemas = load_all_schemas(schema_dir, version=schema_version)
 
     if verbose:
@@ -66,18 +113,41 @@ def validate_dataset(root_dir, verbose=False, schema_version=None, run_bids=Fals
             print(f"⚠️  Failed to update .bidsignore: {e}")
 
     # Walk through subject directories
-    all_items = os.listdir(root_dir)
-    filtered_items = filter_system_files(all_items)
+    with os.scandir(root_dir) as entries:
+        all_entries = list(entries)
+    filtered_entries = [e for e in all_entries if not is_system_file(e.name)]
 
-    if verbose and len(all_items) != len(filtered_items):
-        ignored_count = len(all_items) - len(filtered_items)
+    if verbose and len(all_entries) != len(filtered_entries):
+        ignored_count = len(all_entries) - len(filtered_entries)
         print(f"🗑️  Ignored {ignored_count} system files (.DS_Store, Thumbs.db, etc.)")
 
-    for item in filtered_items:
-        item_path = os.path.join(root_dir, item)
-        if os.path.isdir(item_path) and item.startswith("sub-"):
+    subject_shards = [
+        (entry.path, entry.name, root_dir)
+        for entry in filtered_entries
+        if entry.name.startswith("sub-") and entry.is_dir()
+    ]
+
+    if jobs and jobs > 1 and len(subject_shards) > 1:
+        # Subjects are independent, so shard them across worker processes and
+        # merge the per-subject results back in their original order
+        workers = min(jobs, len(subject_shards))
+        if verbose:
+            print(f"⚙️  Validating {len(subject_shards)} subjects on {workers} workers")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(schema_version, schema_results_snapshot()),
+        ) as executor:
+            for subject_issues, subject_stats, schema_results in executor.map(
+                _validate_subject_shard, subject_shards
+            ):
+                issues.extend(subject_issues)
+                stats.merge(subject_stats)
+                merge_schema_results(schema_results)
+    else:
+        for subject_dir, subject_id, _ in subject_shards:
             subject_issues = _validate_subject(
-                item_path, item, validator, stats, root_dir
+                subject_dir, subject_id, validator, stats, root_dir
             )
             issues.extend(subject_issues)
 
@@ -169,17 +239,12 @@ def _run_bids_validator(root_dir, verbose=False):
 def _validate_subject(subject_dir, subject_id, validator, stats, root_dir):
     issues = []
 
-    all_items = os.listdir(subject_dir)
-    filtered_items = filter_system_files(all_items)
-
-    for item in filtered_items:
-        item_path = os.path.join(subject_dir, item)
-        if os.path.isdir(item_path):
+    for entry in scan_dir_filtered(subject_dir):
+        item = entry.name
+        item_path = entry.path
+        if entry.is_dir():
             # Check for empty directory
-            dir_contents = os.listdir(item_path)
-            filtered_contents = filter_system_files(dir_contents)
-
-            if not filtered_contents:
+            if not scan_dir_filtered(item_path):
                 issues.append(("ERROR", f"Empty directory found: {item_path}"))
                 continue
 
@@ -202,17 +267,12 @@ def _validate_subject(subject_dir, subject_id, validator, stats, root_dir):
 def _validate_session(session_dir, subject_id, session_id, validator, stats, root_dir):
     issues = []
 
-    all_items = os.listdir(session_dir)
-    filtered_items = filter_system_files(all_items)
-
-    for item in filtered_items:
-        item_path = os.path.join(session_dir, item)
-        if os.path.isdir(item_path):
+    for entry in scan_dir_filtered(session_dir):
+        item = entry.name
+        item_path = entry.path
+        if entry.is_dir():
             # Check for empty directory
-            dir_contents = os.listdir(item_path)
-            filtered_contents = filter_system_files(dir_contents)
-
-            if not filtered_contents:
+            if not scan_dir_filtered(item_path):
                 issues.append(("ERROR", f"Empty directory found: {item_path}"))
                 continue
 
@@ -237,18 +297,14 @@ def _validate_modality_dir(
 ):
     issues = []
 
-    all_files = os.listdir(modality_dir)
-    filtered_files = filter_system_files(all_files)
-
-    for fname in filtered_files:
-        file_path = os.path.join(modality_dir, fname)
-        if os.path.isfile(file_path):
+    for entry in scan_dir_filtered(modality_dir):
+        fname = entry.name
+        file_path = entry.path
+        if entry.is_file():
             # Extract task from filename
             task = None
             if "_task-" in fname:
-                import re
-
-                task_match = re.search(r"_task-([A-Za-z0-9]+)(?:_|$)", fname)
+                task_match = _TASK_RE.search(fname)
                 if task_match:
                     task = task_match.group(1)
 
@@ -272,18 +328,15 @@ def _validate_modality_dir(
                 try:
                     sidecar_path = resolve_sidecar_path(file_path, root_dir)
                     if os.path.exists(sidecar_path):
-                        with open(sidecar_path, "r", encoding="utf-8") as f:
-                            data = json.load(f)
-                            if "Study" in data and "OriginalName" in data["Study"]:
-                                original_name = data["Study"]["OriginalName"]
-                                if modality == "survey" and task:
-                                    stats.add_description("survey", task, original_name)
-                                elif modality == "biometrics" and task:
-                                    stats.add_description(
-                                        "biometrics", task, original_name
-                                    )
-                                elif task:
-                                    stats.add_description("task", task, original_name)
+                        data = validator.load_sidecar(sidecar_path)
+                        if "Study" in data and "OriginalName" in data["Study"]:
+                            original_name = data["Study"]["OriginalName"]
+                            if modality == "survey" and task:
+                                stats.add_description("survey", task, original_name)
+                            elif modality == "biometrics" and task:
+                                stats.add_description("biometrics", task, original_name)
+                            elif task:
+                                stats.add_description("task", task, original_name)
                 except Exception:
                     pass  # Don't fail validation if stats extraction fails
 
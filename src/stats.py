@@ -4,6 +4,9 @@ Dataset statistics and consistency checking
 
 import re
 
+_SURVEY_RE = re.compile(r"_survey-([a-zA-Z0-9]+)")
+_BIOMETRICS_RE = re.compile(r"_biometrics-([a-zA-Z0-9]+)")
+
 
 class DatasetStats:
     """Collect and analyze dataset statistics"""
@@ -37,14 +40,14 @@ class DatasetStats:
         if modality == "survey":
             if task:
                 self.surveys.add(task)
-            match = re.search(r"_survey-([a-zA-Z0-9]+)", filename)
+            match = _SURVEY_RE.search(filename)
             if match:
                 self.surveys.add(match.group(1))
 
         if modality == "biometrics":
             if task:
                 self.biometrics.add(task)
-            match = re.search(r"_biometrics-([a-zA-Z0-9]+)", filename)
+            match = _BIOMETRICS_RE.search(filename)
             if match:
                 self.biometrics.add(match.group(1))
 
@@ -79,6 +82,21 @@ class DatasetStats:
             if task:
                 subject_info["session_data"][session_id]["tasks"].add(task)
 
+    def merge(self, other):
+        """Fold statistics collected by another DatasetStats into this one"""
+        self.subjects |= other.subjects
+        self.sessions |= other.sessions
+        for modality, count in other.modalities.items():
+            self.modalities[modality] = self.modalities.get(modality, 0) + count
+        self.tasks |= other.tasks
+        self.surveys |= other.surveys
+        self.biometrics |= other.biometrics
+        for entity_type, names in other.descriptions.items():
+            self.descriptions.setdefault(entity_type, {}).update(names)
+        self.total_files += other.total_files
+        self.sidecar_files += other.sidecar_files
+        self.subject_data.update(other.subject_data)
+
     def add_description(self, entity_type, name, description):
         """Store description (OriginalName) for an entity"""
         if not description:
@@ -3,7 +3,9 @@ System file filtering utilities for cross-platform dataset validation.
 Filters out OS-specific files that shouldn't be included in validation.
 """
 
+import fnmatch
 import os
+import re
 
 # System files to ignore during validation
 SYSTEM_FILES = {
@@ -50,6 +52,14 @@ SYSTEM_FILE_PATTERNS = {
     ".#*",  # Emacs lock files
 }
 
+# All wildcard patterns combined into one regex, compared the way fnmatch does
+_SYSTEM_FILE_PATTERN_RE = re.compile(
+    "|".join(
+        fnmatch.translate(os.path.normcase(pattern))
+        for pattern in sorted(SYSTEM_FILE_PATTERNS)
+    )
+)
+
 
 def is_system_file(filename):
     """
@@ -69,13 +79,7 @@ def is_system_file(filename):
         return True
 
     # Check patterns
-    import fnmatch
-
-    for pattern in SYSTEM_FILE_PATTERNS:
-        if fnmatch.fnmatch(filename, pattern):
-            return True
-
-    return False
+    return _SYSTEM_FILE_PATTERN_RE.match(os.path.normcase(filename)) is not None
 
 
 def filter_system_files(file_list):
@@ -91,6 +95,23 @@ def filter_system_files(file_list):
     return [f for f in file_list if not is_system_file(f)]
 
 
+def scan_dir_filtered(directory):
+    """
+    List a directory with os.scandir, leaving out system files.
+
+    The returned entries carry cached type information, so callers can use
+    entry.is_dir() / entry.is_file() without an extra stat per entry.
+
+    Args:
+        directory (str): Directory to list
+
+    Returns:
+        list: os.DirEntry objects for non-system entries, in listing order
+    """
+    with os.scandir(directory) as entries:
+        return [entry for entry in entries if not is_system_file(entry.name)]
+
+
 def should_validate_file(file_path):
     """
     Check if a file should be included in dataset validation.
@@ -6,6 +6,9 @@ import os
 import re
 import json
 import csv
+import hashlib
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from jsonschema import validate, ValidationError
 from cross_platform import (
@@ -42,6 +45,34 @@ MRI_SUFFIX_REGEX = re.compile(
 # File extensions that need special handling
 COMPOUND_EXTS = (".nii.gz", ".tsv.gz", ".edf.gz")
 
+# Schema check outcomes shared by all validation runs in this process, keyed by
+# (sidecar content digest, modality, schema digest). Unchanged sidecars, such
+# as dataset-level ones inherited by every subject or files in a re-uploaded
+# dataset, are only checked against their schema once.
+SCHEMA_RESULT_CACHE_SIZE = 4096
+_schema_results = OrderedDict()
+_schema_results_lock = threading.Lock()
+
+
+def _text_digest(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def schema_results_snapshot():
+    """Return the cached schema check outcomes as (key, message) pairs"""
+    with _schema_results_lock:
+        return list(_schema_results.items())
+
+
+def merge_schema_results(results):
+    """Add (key, message) pairs, e.g. from a worker process, to the cache"""
+    with _schema_results_lock:
+        for key, message in results:
+            _schema_results[key] = message
+            _schema_results.move_to_end(key)
+        while len(_schema_results) > SCHEMA_RESULT_CACHE_SIZE:
+            _schema_results.popitem(last=False)
+
 
 def split_compound_ext(filename):
     """Return (stem, ext) and handle compound extensions like .nii.gz."""
@@ -121,6 +152,52 @@ class DatasetValidator:
 
     def __init__(self, schemas=None):
         self.schemas = schemas or {}
+        self._sidecar_cache = {}
+        self._sidecar_digests = {}
+        self._schema_digests = {}
+        # Outcomes this validator computed itself, so worker processes can
+        # hand them back to the parent's cache
+        self.computed_schema_results = []
+
+    def load_sidecar(self, sidecar_path):
+        """Parse a JSON sidecar once per validation run.
+
+        Sidecars are read by several checks per data file and dataset-level
+        sidecars are shared by every subject, so parsed content is reused.
+        Raises json.JSONDecodeError for invalid files (not cached).
+        """
+        data = self._sidecar_cache.get(sidecar_path)
+        if data is None:
+            text = CrossPlatformFile.read_text(sidecar_path)
+            data = json.loads(text)
+            self._sidecar_cache[sidecar_path] = data
+            self._sidecar_digests[sidecar_path] = _text_digest(text)
+        return data
+
+    def _schema_error(self, sidecar_path, modality):
+        """Return the schema error message for a sidecar, or None if it conforms"""
+        sidecar_data = self.load_sidecar(sidecar_path)
+        schema = self.schemas[modality]
+        schema_digest = self._schema_digests.get(modality)
+        if schema_digest is None:
+            schema_digest = _text_digest(json.dumps(schema, sort_keys=True))
+            self._schema_digests[modality] = schema_digest
+        key = (self._sidecar_digests[sidecar_path], modality, schema_digest)
+
+        with _schema_results_lock:
+            if key in _schema_results:
+                _schema_results.move_to_end(key)
+                return _schema_results[key]
+
+        try:
+            validate(instance=sidecar_data, schema=schema)
+            message = None
+        except ValidationError as e:
+            message = e.message
+
+        merge_schema_results([(key, message)])
+        self.computed_schema_results.append((key, message))
+        return message
 
     def validate_data_content(self, file_path, modality, root_dir):
         """Validate data content against constraints in sidecar"""
@@ -146,8 +223,7 @@ class DatasetValidator:
                 ]
 
             # Load sidecar
-            sidecar_content = CrossPlatformFile.read_text(sidecar_path)
-            sidecar_data = json.loads(sidecar_content)
+            sidecar_data = self.load_sidecar(sidecar_path)
 
             # Read TSV file
             with open(file_path, "r", newline="", encoding="utf-8") as tsvfile:
@@ -471,19 +547,19 @@ class DatasetValidator:
             return [("ERROR", f"Missing sidecar for {normalize_path(file_path)}")]
 
         try:
-            # Use cross-platform file reading
-            content = CrossPlatformFile.read_text(sidecar_path)
-            sidecar_data = json.loads(content)
+            self.load_sidecar(sidecar_path)
 
             # Validate against schema if available
-            schema = self.schemas.get(modality)
-            if schema:
-                validate(instance=sidecar_data, schema=schema)
+            if self.schemas.get(modality):
+                message = self._schema_error(sidecar_path, modality)
+                if message is not None:
+                    issues.append(
+                        (
+                            "ERROR",
+                            f"{normalize_path(sidecar_path)} schema error: {message}",
+                        )
+                    )
 
-        except ValidationError as e:
-            issues.append(
-                ("ERROR", f"{normalize_path(sidecar_path)} schema error: {e.message}")
-            )
         except json.JSONDecodeError as e:
             issues.append(
                 ("ERROR", f"{normalize_path(sidecar_path)} is not valid JSON: {e}")